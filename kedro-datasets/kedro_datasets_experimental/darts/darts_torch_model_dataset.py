@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-import copy
 import os
 from inspect import isclass
 from pathlib import PurePosixPath
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import fsspec
-from darts import models
-from darts.models.forecasting.torch_forecasting_model import TorchForecastingModel
 from kedro.io.core import (
     AbstractVersionedDataset,
     DatasetError,
@@ -17,9 +14,12 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+if TYPE_CHECKING:
+    from darts.models.forecasting.torch_forecasting_model import TorchForecastingModel
+
 
 class DartsTorchModelDataset(
-    AbstractVersionedDataset[TorchForecastingModel, TorchForecastingModel]
+    AbstractVersionedDataset["TorchForecastingModel", "TorchForecastingModel"]
 ):
     """DartsTorchModelDataset loads and saves Darts TorchForecastingModel instances.
     The underlying functionality is supported by, and passes arguments through to,
@@ -68,6 +68,10 @@ class DartsTorchModelDataset(
     DEFAULT_LOAD_ARGS: dict[str, Any] = {}
     DEFAULT_SAVE_ARGS: dict[str, Any] = {}
 
+    # Parent directories already created by any instance, so repeated saves
+    # into the same directory do not repeat the mkdir syscall.
+    _created_dirs: set[str] = set()
+
     def __init__(  # noqa: PLR0913
             self,
             *,
@@ -99,36 +103,31 @@ class DartsTorchModelDataset(
                 If its load attribute is None, the latest version will be loaded.
                 If its save attribute is None, save version will be autogenerated.
             credentials: Credentials required to access the underlying filesystem.
+                Copied shallowly: mutable values (e.g. a shared boto session) are
+                shared with the caller, not duplicated.
             fs_args: Extra arguments to pass into the underlying filesystem class constructor
-                (e.g., {"project": "my-project"} for GCSFileSystem).
+                (e.g., {"project": "my-project"} for GCSFileSystem). Filesystem
+                instances are cached by fsspec, so datasets sharing a protocol and
+                identical credentials/fs_args reuse a single client. Like
+                ``credentials``, copied shallowly.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         """
-        _fs_args = copy.deepcopy(fs_args) or {}
-        _credentials = copy.deepcopy(credentials) or {}
+        _fs_args = dict(fs_args) if fs_args else {}
+        _credentials = dict(credentials) if credentials else {}
         protocol, path = get_protocol_and_path(filepath, version)
         if protocol == "file":
             _fs_args.setdefault("auto_mkdir", True)
-
+        # fsspec caches filesystem instances by constructor kwargs, so datasets
+        # pointing at the same protocol with the same credentials/fs_args share
+        # one client instead of each building their own. Users can opt out by
+        # passing `skip_instance_cache: true` in `fs_args`.
         self._protocol = protocol
         self._fs = fsspec.filesystem(self._protocol, **_credentials, **_fs_args)
 
         self.metadata = metadata
 
-        # Handle model_class being a string or a class object
-        if isinstance(model_class, str):
-            try:
-                self.model_class = getattr(models, model_class)
-            except AttributeError as e:
-                raise ValueError(
-                    f"Model class '{model_class}' not found in darts.models."
-                ) from e
-        elif isclass(model_class) and issubclass(model_class, TorchForecastingModel):
-            self.model_class = model_class
-        else:
-            raise ValueError(
-                "model_class must be a string or a TorchForecastingModel subclass"
-            )
+        self.model_class = self._resolve_model_class(model_class)
 
         super().__init__(
             filepath=PurePosixPath(path),
@@ -140,6 +139,34 @@ class DartsTorchModelDataset(
         self._load_args = {**self.DEFAULT_LOAD_ARGS, **(load_args or {})}
         self._save_args = {**self.DEFAULT_SAVE_ARGS, **(save_args or {})}
 
+    @staticmethod
+    def _resolve_model_class(
+        model_class: str | type[TorchForecastingModel],
+    ) -> type[TorchForecastingModel]:
+        """Resolve model_class to a TorchForecastingModel subclass.
+
+        darts (and through it torch) is imported here rather than at module
+        scope, so that parsing a catalog does not pay the import cost.
+        """
+        from darts.models.forecasting.torch_forecasting_model import (  # noqa: PLC0415
+            TorchForecastingModel,
+        )
+
+        if isinstance(model_class, str):
+            from darts import models  # noqa: PLC0415
+
+            try:
+                return getattr(models, model_class)
+            except AttributeError as e:
+                raise ValueError(
+                    f"Model class '{model_class}' not found in darts.models."
+                ) from e
+        if isclass(model_class) and issubclass(model_class, TorchForecastingModel):
+            return model_class
+        raise ValueError(
+            "model_class must be a string or a TorchForecastingModel subclass"
+        )
+
     def load(self) -> TorchForecastingModel:
         """
         Loads a TorchForecastingModel using the specified load method.
@@ -191,17 +218,28 @@ class DartsTorchModelDataset(
         # Skipping model save as 'save_model' is set to False.
         if save_model:
             raw_path = self._get_save_path()
-            os.makedirs(os.path.dirname(str(raw_path)), exist_ok=True)
+            self._makedirs_cached(os.path.dirname(str(raw_path)))
             save_path = get_filepath_str(raw_path, protocol=self._protocol)
             data.save(save_path, **save_args)
 
+    @classmethod
+    def _makedirs_cached(cls, directory: str) -> None:
+        if directory not in cls._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            cls._created_dirs.add(directory)
+
     def _exists(self) -> bool:
         try:
-            load_path = get_filepath_str(self._get_load_path(), self._protocol)
-            return self._fs.exists(load_path)
+            load_path = self._get_load_path()
         except DatasetError:
             return False
 
+        if self._protocol == "file":
+            # Ask the OS directly for local paths; the fsspec wrapper only
+            # adds cache bookkeeping on top of the same stat call.
+            return os.path.exists(str(load_path))
+        return self._fs.exists(get_filepath_str(load_path, self._protocol))
+
     def _describe(self) -> dict[str, Any]:
         return {
             "filepath": self._filepath,
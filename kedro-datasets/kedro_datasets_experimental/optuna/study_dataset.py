@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import fnmatch
+import json
 import logging
 import os
+import re
+import time
 from copy import deepcopy
 from pathlib import PurePosixPath
 from typing import Any
@@ -15,12 +18,21 @@ from kedro.io.core import (
     DatasetError,
     Version,
 )
-from sqlalchemy import URL
+from sqlalchemy import URL, event, insert, select
 from sqlalchemy.dialects import registry
+from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
 
+def _sqlite_on_connect(dbapi_connection, connection_record):
+    """Enable WAL mode so concurrent readers are not blocked by a writer."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
     """``StudyDataset`` loads/saves data from/to an optuna Study.
 
@@ -48,6 +60,11 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
           database: optuna_db
           credentials: dev_optuna_postgresql
 
+        sales_prediction_study:
+          type: kedro_datasets_experimental.optuna.StudyDataset
+          backend: journal
+          database: data/05_model_input/sales_prediction_study.log
+
     Example usage for the
     `Python API <https://docs.kedro.org/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -75,6 +92,15 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
 
     DEFAULT_LOAD_ARGS: dict[str, Any] = {"sampler": None, "pruner": None}
 
+    # How long a fetched list of study names stays valid, in seconds. Existence
+    # and glob checks often run several times within a single save/load, and
+    # each uncached call is a full `SELECT` against the RDB backend.
+    _STUDY_NAMES_CACHE_TTL: float = 1.0
+
+    # Parent directories already created by any instance, so repeated saves
+    # into the same directory do not repeat the mkdir syscall.
+    _created_dirs: set[str] = set()
+
     def __init__(  # noqa: PLR0913
         self,
         *,
@@ -91,8 +117,11 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
 
         Args:
             backend: Name of the database backend. This name should correspond to a module
-                in ``SQLAlchemy``.
-            database: Name of the database.
+                in ``SQLAlchemy``, or be ``journal`` to store studies in Optuna's
+                append-only journal file, which avoids SQL entirely and suits
+                append-mostly studies with many trials.
+            database: Name of the database. For the ``journal`` backend, path to
+                the journal log file.
             study_name: Name of the optuna Study.
             load_args: Optuna options for loading studies. Accepts a `sampler` and a
                 `pruner`. If either are provided, a `class` matching any Optuna `sampler`,
@@ -116,18 +145,29 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
         self._study_name = self._validate_study_name(study_name=study_name)
 
         credentials = self._validate_credentials(backend=backend, credentials=credentials)
-        storage_url = URL.create(
-            drivername=backend,
-            database=database,
-            **credentials,
-        )
+        if backend == "journal":
+            # The journal backend appends to a plain log file; no URL involved
+            storage_url = None
+            self._storage_url_str = None
+        else:
+            storage_url = URL.create(
+                drivername=backend,
+                database=database,
+                **credentials,
+            )
+            self._storage_url_str = storage_url.render_as_string(hide_password=False)
 
         self._storage_url = storage_url
+        self._storage_obj: optuna.storages.BaseStorage | None = None
+        self._study_names_cache: tuple[float, list[str]] | None = None
+        self._sampler_factory: tuple[type, dict[str, Any]] | None = None
+        self._pruner_factory: tuple[type, dict[str, Any]] | None = None
+        self._factories_resolved = False
         self.metadata = metadata
 
         filepath = None
-        if backend == "sqlite":
-            filepath = PurePosixPath(os.path.realpath(database))
+        if backend in ("sqlite", "journal"):
+            filepath = PurePosixPath(os.path.abspath(database))
 
         super().__init__(
             filepath=filepath,
@@ -140,7 +180,7 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
         self._load_args = {**self.DEFAULT_LOAD_ARGS, **(load_args or {})}
 
     def _validate_backend(self, backend):
-        valid_backends = list(registry.impls.keys()) + ["mssql", "mysql", "oracle", "postgresql", "sqlite"]
+        valid_backends = list(registry.impls.keys()) + ["journal", "mssql", "mysql", "oracle", "postgresql", "sqlite"]
         if backend not in valid_backends:
             raise ValueError(
                 f"Requested `backend` '{backend}' is not registered as an SQLAlchemy dialect."
@@ -151,14 +191,14 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
         if not isinstance(database, str):
             raise ValueError(f"`database` '{database}' is not a string.")
 
-        if backend == "sqlite":
-            if database == ":memory:":
+        if backend in ("sqlite", "journal"):
+            if backend == "sqlite" and database == ":memory:":
                 return database
 
             # Check if the file has an extension
             _, extension = os.path.splitext(database)
             if not extension:
-                raise ValueError(f"The sqlite file `database` '{database}' does not have an extension.")
+                raise ValueError(f"The {backend} file `database` '{database}' does not have an extension.")
 
         return database
 
@@ -168,7 +208,7 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
         return study_name
 
     def _validate_credentials(self, backend, credentials):
-        if backend == "sqlite" or credentials is None:
+        if backend in ("sqlite", "journal") or credentials is None:
             return {}
 
         if not set(credentials.keys()) <= {"username", "password", "host", "port"}:
@@ -178,7 +218,13 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
                 f"{set(credentials.keys())}."
             )
 
-        return deepcopy(credentials)
+        return dict(credentials)
+
+    @classmethod
+    def _makedirs_cached(cls, directory: str) -> None:
+        if directory not in cls._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            cls._created_dirs.add(directory)
 
     def _get_versioned_path(self, version: str) -> PurePosixPath:
         study_name_posix = PurePosixPath(self._study_name)
@@ -233,10 +279,44 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
             "version": self._version,
         }
 
-    def _get_sampler(self, sampler_config):
-        if sampler_config is None:
-            return None
+    def _get_storage(self) -> optuna.storages.BaseStorage:
+        """Return the shared storage object, creating it on first use.
 
+        Creating an ``RDBStorage`` builds an SQLAlchemy engine with its
+        connection pool, so a single instance is kept and reused by all
+        load/save/existence calls instead of being rebuilt per call. Creation
+        is deferred so that instantiating the dataset does not touch the
+        database. The ``journal`` backend replays an append-only log file
+        in memory instead of going through SQL.
+        """
+        if self._storage_obj is None:
+            if self._backend == "journal":
+                from optuna.storages.journal import JournalFileBackend  # noqa: PLC0415
+
+                self._storage_obj = optuna.storages.JournalStorage(
+                    JournalFileBackend(str(self._filepath))
+                )
+                return self._storage_obj
+
+            if self._backend == "sqlite":
+                engine_kwargs = {"connect_args": {"timeout": 300}}
+            else:
+                engine_kwargs = {"pool_pre_ping": True}
+
+            self._storage_obj = optuna.storages.RDBStorage(
+                url=self._storage_url_str,
+                engine_kwargs=engine_kwargs,
+            )
+            if self._backend == "sqlite" and self._database != ":memory:":
+                # WAL mode only applies to on-disk databases; disposing an
+                # in-memory database's sole connection would drop the database
+                # itself, schema included.
+                event.listen(self._storage_obj.engine, "connect", _sqlite_on_connect)
+                # Recycle connections opened before the listener was attached
+                self._storage_obj.engine.dispose()
+        return self._storage_obj
+
+    def _resolve_sampler(self, sampler_config):
         if "class" not in sampler_config:
             raise ValueError(
                 "Optuna `sampler` 'class' should be specified when trying to load study "
@@ -254,14 +334,16 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
                 sampler_config.pop("base_sampler")
             )
 
-        sampler_class = getattr(optuna.samplers, sampler_class_name)
-
-        return sampler_class(**sampler_config)
+        return getattr(optuna.samplers, sampler_class_name), sampler_config
 
-    def _get_pruner(self, pruner_config):
-        if pruner_config is None:
+    def _get_sampler(self, sampler_config):
+        if sampler_config is None:
             return None
 
+        sampler_class, sampler_kwargs = self._resolve_sampler(sampler_config)
+        return sampler_class(**sampler_kwargs)
+
+    def _resolve_pruner(self, pruner_config):
         if "class" not in pruner_config:
             raise ValueError(
                 "Optuna `pruner` 'class' should be specified when trying to load study "
@@ -274,22 +356,51 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
                 pruner_config.pop("wrapped_pruner")
             )
 
-        pruner_class = getattr(optuna.pruners, pruner_class_name)
+        return getattr(optuna.pruners, pruner_class_name), pruner_config
 
-        return pruner_class(**pruner_config)
+    def _get_pruner(self, pruner_config):
+        if pruner_config is None:
+            return None
 
-    def load(self) -> optuna.Study:
-        load_args = deepcopy(self._load_args)
-        sampler_config = load_args.pop("sampler")
-        sampler = self._get_sampler(sampler_config)
+        pruner_class, pruner_kwargs = self._resolve_pruner(pruner_config)
+        return pruner_class(**pruner_kwargs)
 
-        pruner_config = load_args.pop("pruner")
-        pruner = self._get_pruner(pruner_config)
+    def _resolve_factories(self) -> None:
+        """Resolve the sampler and pruner configs into ``(class, kwargs)`` pairs.
+
+        Resolution runs once per dataset, on the first ``load()`` so that
+        configuration errors still surface at load time. The configs are
+        deep-copied first because resolution pops the ``class`` keys, and the
+        stored load args must stay intact for subsequent loads.
+        """
+        if self._factories_resolved:
+            return
+
+        sampler_config = self._load_args.get("sampler")
+        if sampler_config is not None:
+            self._sampler_factory = self._resolve_sampler(deepcopy(sampler_config))
+
+        pruner_config = self._load_args.get("pruner")
+        if pruner_config is not None:
+            self._pruner_factory = self._resolve_pruner(deepcopy(pruner_config))
+
+        self._factories_resolved = True
+
+    def load(self) -> optuna.Study:
+        self._resolve_factories()
+        sampler = (
+            self._sampler_factory[0](**self._sampler_factory[1])
+            if self._sampler_factory
+            else None
+        )
+        pruner = (
+            self._pruner_factory[0](**self._pruner_factory[1])
+            if self._pruner_factory
+            else None
+        )
 
-        storage_url_str = self._storage_url.render_as_string(hide_password=False)
-        storage = optuna.storages.RDBStorage(url=storage_url_str)
         study = optuna.load_study(
-            storage=storage,
+            storage=self._get_storage(),
             study_name=self._get_load_study_name(),
             sampler=sampler,
             pruner=pruner,
@@ -300,47 +411,259 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
     def save(self, study: optuna.Study) -> None:
         save_study_name = self._get_save_study_name()
 
-        storage_url_str = self._storage_url.render_as_string(hide_password=False)
-        if self._backend == "sqlite":
-            os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+        # Stat the backing file once and reuse the result below instead of
+        # letting each existence check repeat it.
+        file_exists = True
+        if self._backend in ("sqlite", "journal"):
+            file_exists = os.path.isfile(self._filepath)
+            if not file_exists:
+                self._makedirs_cached(os.path.dirname(str(self._filepath)))
 
-            if not os.path.isfile(self._filepath):
-                optuna.create_study(
-                    storage=storage_url_str,
-                )
-
-        storage = optuna.storages.RDBStorage(url=storage_url_str)
+        # Creating the storage also creates the database schema if needed
+        storage = self._get_storage()
 
         # To overwrite an existing study, we need to first delete it if it exists
-        if self._study_name_exists(save_study_name):
+        if self._study_name_exists(save_study_name, _known_file_exists=file_exists):
             optuna.delete_study(
                 storage=storage,
                 study_name=save_study_name,
             )
 
-        optuna.copy_study(
-            from_study_name=study.study_name,
-            from_storage=study._storage,
-            to_storage=storage,
-            to_study_name=save_study_name,
+        if isinstance(storage, optuna.storages.RDBStorage):
+            self._copy_study_bulk(study, storage, save_study_name)
+        else:
+            optuna.copy_study(
+                from_study_name=study.study_name,
+                from_storage=study._storage,
+                to_storage=storage,
+                to_study_name=save_study_name,
+            )
+
+        # The study list has changed, so the next existence/glob check must
+        # hit the database again.
+        self._study_names_cache = None
+
+    def _copy_study_bulk(
+        self,
+        study: optuna.Study,
+        storage: optuna.storages.RDBStorage,
+        save_study_name: str,
+    ) -> None:
+        """Copy ``study`` into ``storage`` under ``save_study_name``.
+
+        ``optuna.copy_study`` re-inserts trials one at a time, each in its own
+        transaction, which makes saving large studies scale poorly. Instead,
+        write the trial rows directly through the storage engine so each table
+        gets a single bulk insert inside one transaction.
+        """
+        from optuna.storages._rdb import models as rdb_models  # noqa: PLC0415
+
+        study_id = storage.create_new_study(
+            directions=study.directions, study_name=save_study_name
         )
 
-    def _study_name_exists(self, study_name) -> bool:
-        if self._backend == "sqlite" and not os.path.isfile(self._database):
-            return False
+        for key, value in study._storage.get_study_system_attrs(study._study_id).items():
+            storage.set_study_system_attr(study_id, key, value)
+
+        for key, value in study.user_attrs.items():
+            storage.set_study_user_attr(study_id, key, value)
+
+        trials = study.get_trials(deepcopy=False)
+        if not trials:
+            return
+
+        with Session(storage.engine) as session:
+            session.execute(
+                insert(rdb_models.TrialModel),
+                [
+                    {
+                        "number": trial.number,
+                        "study_id": study_id,
+                        "state": trial.state,
+                        "datetime_start": trial.datetime_start,
+                        "datetime_complete": trial.datetime_complete,
+                    }
+                    for trial in trials
+                ],
+            )
+
+            # Map the freshly generated trial ids back onto the trial numbers
+            # so the child table rows can reference them.
+            trial_ids = dict(
+                session.execute(
+                    select(
+                        rdb_models.TrialModel.number, rdb_models.TrialModel.trial_id
+                    ).where(rdb_models.TrialModel.study_id == study_id)
+                ).all()
+            )
+
+            for model, rows in self._build_trial_rows(trials, trial_ids).items():
+                if rows:
+                    session.execute(insert(model), rows)
+
+            session.commit()
+
+    @staticmethod
+    def _build_trial_rows(trials, trial_ids):
+        """Build the child-table rows referencing the newly inserted trials,
+        keyed by the model they belong to."""
+        from optuna.distributions import distribution_to_json  # noqa: PLC0415
+        from optuna.storages._rdb import models as rdb_models  # noqa: PLC0415
+
+        param_rows = []
+        value_rows = []
+        intermediate_value_rows = []
+        user_attr_rows = []
+        system_attr_rows = []
+        for trial in trials:
+            trial_id = trial_ids[trial.number]
+
+            for param_name, param_value in trial.params.items():
+                distribution = trial.distributions[param_name]
+                param_rows.append(
+                    {
+                        "trial_id": trial_id,
+                        "param_name": param_name,
+                        "param_value": distribution.to_internal_repr(param_value),
+                        "distribution_json": distribution_to_json(distribution),
+                    }
+                )
+
+            for objective, value in enumerate(trial.values or []):
+                stored_value, value_type = (
+                    rdb_models.TrialValueModel.value_to_stored_repr(value)
+                )
+                value_rows.append(
+                    {
+                        "trial_id": trial_id,
+                        "objective": objective,
+                        "value": stored_value,
+                        "value_type": value_type,
+                    }
+                )
+
+            for step, intermediate_value in trial.intermediate_values.items():
+                stored_value, value_type = (
+                    rdb_models.TrialIntermediateValueModel.intermediate_value_to_stored_repr(
+                        intermediate_value
+                    )
+                )
+                intermediate_value_rows.append(
+                    {
+                        "trial_id": trial_id,
+                        "step": step,
+                        "intermediate_value": stored_value,
+                        "intermediate_value_type": value_type,
+                    }
+                )
+
+            for key, value in trial.user_attrs.items():
+                user_attr_rows.append(
+                    {"trial_id": trial_id, "key": key, "value_json": json.dumps(value)}
+                )
+
+            for key, value in trial.system_attrs.items():
+                system_attr_rows.append(
+                    {"trial_id": trial_id, "key": key, "value_json": json.dumps(value)}
+                )
+
+        return {
+            rdb_models.TrialParamModel: param_rows,
+            rdb_models.TrialValueModel: value_rows,
+            rdb_models.TrialIntermediateValueModel: intermediate_value_rows,
+            rdb_models.TrialUserAttributeModel: user_attr_rows,
+            rdb_models.TrialSystemAttributeModel: system_attr_rows,
+        }
 
-        storage_url_str = self._storage_url.render_as_string(hide_password=False)
-        storage = optuna.storages.RDBStorage(url=storage_url_str)
-        study_names = optuna.study.get_all_study_names(storage=storage)
-        return study_name in study_names
+    def _get_study_names(self, force: bool = False) -> list[str]:
+        if not force and self._study_names_cache is not None:
+            timestamp, study_names = self._study_names_cache
+            if time.monotonic() - timestamp < self._STUDY_NAMES_CACHE_TTL:
+                return study_names
+
+        study_names = optuna.study.get_all_study_names(storage=self._get_storage())
+        self._study_names_cache = (time.monotonic(), study_names)
+        return study_names
+
+    def _study_name_exists(
+        self, study_name, _known_file_exists: bool | None = None
+    ) -> bool:
+        if self._backend in ("sqlite", "journal"):
+            file_exists = (
+                _known_file_exists
+                if _known_file_exists is not None
+                else os.path.isfile(self._database)
+            )
+            if not file_exists:
+                return False
+
+        if self._backend == "journal":
+            return study_name in self._get_study_names()
+
+        from optuna.storages._rdb.models import StudyModel  # noqa: PLC0415
+
+        # Query the single row directly instead of fetching every study name,
+        # so the check stays constant-time regardless of the number of studies.
+        # Built with SQLAlchemy Core so each dialect renders its own row-limit
+        # syntax (LIMIT, TOP, FETCH FIRST, ...).
+        with self._get_storage().engine.connect() as connection:
+            row = connection.execute(
+                select(StudyModel.study_id)
+                .where(StudyModel.study_name == study_name)
+                .limit(1)
+            ).first()
+        return row is not None
+
+    @staticmethod
+    def _fnmatch_to_like(pattern: str) -> str | None:
+        """Translate an fnmatch pattern into an SQL ``LIKE`` pattern.
+
+        Returns None when the pattern uses ``[...]`` character classes, which
+        ``LIKE`` cannot express.
+        """
+        if "[" in pattern:
+            return None
+
+        like_pattern = []
+        for char in pattern:
+            if char == "*":
+                like_pattern.append("%")
+            elif char == "?":
+                like_pattern.append("_")
+            elif char in ("%", "_", "\\"):
+                like_pattern.append("\\" + char)
+            else:
+                like_pattern.append(char)
+        return "".join(like_pattern)
 
     def _study_name_glob(self, pattern):
-        storage_url_str = self._storage_url.render_as_string(hide_password=False)
-        storage = optuna.storages.RDBStorage(url=storage_url_str)
-        study_names = optuna.study.get_all_study_names(storage=storage)
-        for study_name in study_names:
-            if fnmatch.fnmatch(study_name, pattern):
-                yield study_name
+        # Compile the pattern once instead of once per name
+        regex = re.compile(fnmatch.translate(pattern))
+
+        like_pattern = None if self._backend == "journal" else self._fnmatch_to_like(pattern)
+        if like_pattern is None:
+            # Filter in Python for patterns LIKE cannot express and for the
+            # journal backend, which has no SQL to push the filter into
+            for study_name in self._get_study_names():
+                if regex.match(study_name):
+                    yield study_name
+            return
+
+        from optuna.storages._rdb.models import StudyModel  # noqa: PLC0415
+
+        # Let the database filter the names so only matching rows are fetched.
+        # LIKE is case-insensitive on some backends (sqlite, MySQL default
+        # collations), so the few fetched rows are re-checked against the
+        # regex to preserve fnmatch's case-sensitive semantics.
+        with self._get_storage().engine.connect() as connection:
+            result = connection.execute(
+                select(StudyModel.study_name).where(
+                    StudyModel.study_name.like(like_pattern, escape="\\")
+                )
+            )
+            for (study_name,) in result:
+                if regex.match(study_name):
+                    yield study_name
 
     def _exists(self) -> bool:
         try:
@@ -349,3 +672,11 @@ class StudyDataset(AbstractVersionedDataset[optuna.Study, optuna.Study]):
             return False
 
         return self._study_name_exists(load_study_name)
+
+    def _release(self) -> None:
+        super()._release()
+        self._study_names_cache = None
+        if isinstance(self._storage_obj, optuna.storages.RDBStorage):
+            self._storage_obj.remove_session()
+            self._storage_obj.engine.dispose()
+        self._storage_obj = None
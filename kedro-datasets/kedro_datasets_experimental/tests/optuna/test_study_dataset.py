@@ -61,6 +61,19 @@ class TestStudyDataset:
         study_dataset.save(dummy_study)
         assert study_dataset.exists()
 
+    def test_save_and_load_in_memory(self, dummy_study):
+        """Test saving and reloading with an in-memory sqlite database."""
+        study_dataset = StudyDataset(
+            study_name="test",
+            backend="sqlite",
+            database=":memory:",
+        )
+        study_dataset.save(dummy_study)
+        reloaded = study_dataset.load()
+
+        assert len(reloaded.trials) == len(dummy_study.trials)
+        assert reloaded.trials[0].params["x"] == dummy_study.trials[0].params["x"]
+
     def test_invalid_backend(self):
         """Test invalid backend raises ValueError."""
         with pytest.raises(ValueError, match="is not registered as an SQLAlchemy dialect"):
@@ -137,6 +150,32 @@ class TestStudyDataset:
         study_names = list(study_dataset._study_name_glob("test"))
         assert "test" in study_names
 
+    @pytest.mark.parametrize(
+        "pattern, like_pattern",
+        [
+            ("test*", "test%"),
+            ("te?t", "te_t"),
+            ("100%", "100\\%"),
+            ("a_b", "a\\_b"),
+            ("a\\b", "a\\\\b"),
+            ("te[st]", None),
+        ],
+    )
+    def test_fnmatch_to_like(self, pattern, like_pattern):
+        """Test fnmatch pattern to SQL LIKE pattern translation."""
+        assert StudyDataset._fnmatch_to_like(pattern) == like_pattern
+
+    def test_study_name_glob_character_class(self, study_dataset, dummy_study):
+        """Test `_study_name_glob` falls back to fnmatch for `[...]` patterns."""
+        study_dataset.save(dummy_study)
+        assert "test" in list(study_dataset._study_name_glob("te[rs]t"))
+        assert list(study_dataset._study_name_glob("te[xy]t")) == []
+
+    def test_study_name_glob_case_sensitive(self, study_dataset, dummy_study):
+        """Test `_study_name_glob` does not match case variants of the pattern."""
+        study_dataset.save(dummy_study)
+        assert list(study_dataset._study_name_glob("Te*")) == []
+
     @pytest.mark.parametrize("load_args", [{"sampler": "test"}], indirect=True)
     def test_load_extra_params(self, study_dataset, load_args):
         """Test overriding the default load arguments."""
@@ -177,6 +216,54 @@ class TestStudyDataset:
             study_dataset._get_pruner({})
 
 
+class TestStudyDatasetJournal:
+    @pytest.fixture
+    def journal_study_dataset(self, tmp_path, load_args):
+        return StudyDataset(
+            study_name="test",
+            backend="journal",
+            database=(tmp_path / "optuna.log").as_posix(),
+            load_args=load_args,
+        )
+
+    def test_save_and_load(self, journal_study_dataset, dummy_study):
+        """Test saving and reloading the dataset with the journal backend."""
+        journal_study_dataset.save(dummy_study)
+        reloaded = journal_study_dataset.load()
+
+        assert len(reloaded.trials) == len(dummy_study.trials)
+        assert reloaded.trials[0].params["x"] == dummy_study.trials[0].params["x"]
+        assert reloaded.trials[0].value == dummy_study.trials[0].value
+
+    def test_exists(self, journal_study_dataset, dummy_study):
+        """Test `exists` method invocation for both existing and nonexistent dataset."""
+        assert not journal_study_dataset.exists()
+        journal_study_dataset.save(dummy_study)
+        assert journal_study_dataset.exists()
+
+    def test_overwrite(self, journal_study_dataset, dummy_study):
+        """Test that saving twice overwrites the existing study."""
+        journal_study_dataset.save(dummy_study)
+        journal_study_dataset.save(dummy_study)
+        reloaded = journal_study_dataset.load()
+        assert len(reloaded.trials) == len(dummy_study.trials)
+
+    def test_invalid_database(self):
+        """Test journal database without an extension raises ValueError."""
+        with pytest.raises(ValueError, match="does not have an extension"):
+            StudyDataset(
+                study_name="test",
+                backend="journal",
+                database="optuna",
+            )
+
+    def test_study_name_glob(self, journal_study_dataset, dummy_study):
+        """Test `_study_name_glob` method with the journal backend."""
+        journal_study_dataset.save(dummy_study)
+        study_names = list(journal_study_dataset._study_name_glob("te*"))
+        assert "test" in study_names
+
+
 class TestStudyDatasetVersioned:
     def test_save_and_load(self, versioned_study_dataset, dummy_study):
         """Test that saved and reloaded data matches the original one for